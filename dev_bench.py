@@ -0,0 +1,345 @@
+import argparse
+import contextlib
+import json
+import os
+from pathlib import Path
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Optional
+from unittest import mock
+
+import toml
+
+import dev_fns
+
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_REPEAT = 3
+DEFAULT_SEED = 42
+DEFAULT_THRESHOLD = 0.25  # Allowed slowdown relative to the baseline before a case is reported as a regression
+
+# The file mix of a synthetic addon tree, as (suffix, weight, is_binary)
+FILE_MIX = [
+    ('.py', 60, False),
+    ('.json', 8, False),
+    ('.toml', 3, False),
+    ('.txt', 4, False),
+    ('.png', 15, True),
+    ('.blend', 5, True),
+    ('.bin', 5, True),
+]
+LIBS_RATIO = 0.2  # Share of the files placed in the vendored 'libs' directory
+FILES_PER_DIR = 50  # Maximum number of files per directory, keeps the tree nested like a real addon
+STUB_GIT_PACKAGE = 'bench_git_dep'
+
+
+# region Synthetic Addon Tree
+
+def _make_text(rng: random.Random, suffix: str) -> str:
+    """
+    Make the content of a synthetic text file.
+
+    Args:
+        rng: The random generator used to keep the content reproducible.
+        suffix: The suffix of the file, used to pick a plausible content layout.
+
+    Returns:
+        The text content of the file.
+    """
+    line_count = rng.randint(10, 80)
+    if suffix == '.py':
+        lines = [f'def func_{i}(value_{i}):\n'
+                 f'    return value_{i} * {rng.randint(0, 9999)}\n' for i in range(line_count)]
+    elif suffix == '.json':
+        lines = (['{\n'] + [f'    "key_{i}": {rng.randint(0, 9999)},\n' for i in range(line_count)]
+                 + ['    "end": 0\n}\n'])
+    elif suffix == '.toml':
+        lines = [f'key_{i} = {rng.randint(0, 9999)}\n' for i in range(line_count)]
+    else:
+        lines = [f'line {i} {rng.randint(0, 9999)}\n' for i in range(line_count)]
+    return ''.join(lines)
+
+
+def generate_addon_tree(root: Path, file_count: int, seed: int = DEFAULT_SEED) -> Path:
+    """
+    Generate a reproducible synthetic addon source tree. The same file count and seed always produce the same tree. The
+    tree contains a mix of text and binary files spread over nested packages and a vendored 'libs' directory.
+
+    Args:
+        root: The directory in which the addon directory is created.
+        file_count: The total number of files in the addon tree.
+        seed: The seed of the random generator.
+
+    Returns:
+        The path of the generated addon directory.
+    """
+    rng = random.Random(f'{seed}-{file_count}')
+    addon_dir = root / 'synthetic_addon'
+    if addon_dir.exists():
+        shutil.rmtree(addon_dir)
+    addon_dir.mkdir(parents=True)
+    (addon_dir / '__init__.py').write_text('bl_info = {"name": "Synthetic Addon"}\n')
+    suffixes = [suffix for suffix, _, _ in FILE_MIX]
+    weights = [weight for _, weight, _ in FILE_MIX]
+    binary_suffixes = {suffix for suffix, _, is_binary in FILE_MIX if is_binary}
+    libs_count = int(file_count * LIBS_RATIO)
+    for i in range(file_count - 1):
+        # Place the first files in 'libs' and the rest in the addon packages, FILES_PER_DIR files per directory
+        if i < libs_count:
+            file_dir = addon_dir / 'libs' / f'vendored_{i // (FILES_PER_DIR * 10)}' / f'mod_{i // FILES_PER_DIR}'
+        else:
+            j = i - libs_count
+            file_dir = addon_dir / f'pkg_{j // (FILES_PER_DIR * 10)}' / f'sub_{j // FILES_PER_DIR}'
+        file_dir.mkdir(parents=True, exist_ok=True)
+        suffix = rng.choices(suffixes, weights)[0]
+        file_path = file_dir / f'file_{i}{suffix}'
+        if suffix in binary_suffixes:
+            file_path.write_bytes(rng.randbytes(rng.randint(512, 8192)))
+        else:
+            file_path.write_text(_make_text(rng, suffix))
+    return addon_dir
+
+# endregion Synthetic Addon Tree
+
+
+# region Stubs
+
+def _stub_subprocess_run(args, *_, **kwargs) -> subprocess.CompletedProcess:
+    """
+    Stand-in for subprocess.run that emulates the Poetry and pip commands called by dev_fns without running them.
+    'poetry export' writes a requirements file with one PyPI and one git dependency, and 'pip install -t' creates the
+    git dependency package in the target directory.
+    """
+    args = [str(arg) for arg in args]
+    if args[:2] == ['poetry', 'export']:
+        Path(args[args.index('-o') + 1]).write_text(
+            'toml==0.10.2 ; python_version >= "3.11" and python_version < "3.12"\n'
+            f'{STUB_GIT_PACKAGE} @ git+https://example.invalid/{STUB_GIT_PACKAGE}.git\n')
+    elif 'pip' in args and 'install' in args:
+        package_dir = Path(args[args.index('-t') + 1]) / STUB_GIT_PACKAGE
+        package_dir.mkdir(parents=True, exist_ok=True)
+        (package_dir / '__init__.py').write_text('VERSION = "0.0.0"\n')
+    return subprocess.CompletedProcess(args, 0, stdout='', stderr='')
+
+
+@contextlib.contextmanager
+def _bench_environment(work_dir: Path, addon_dir: Path):
+    """
+    Point dev_fns at a dev_config.toml inside the work directory, stub Poetry and pip, keep temporary build directories
+    inside the work directory and silence the output of the benchmarked functions.
+
+    Args:
+        work_dir: The directory holding the installation, distribution and temporary build directories.
+        addon_dir: The synthetic addon source code directory.
+    """
+    dev_config_toml_path = work_dir / 'dev_config.toml'
+    dev_config_toml = {'addon': dict(dev_fns.DEFAULT_DEV_CONFIG_TOML['addon'])}
+    dev_config_toml['addon'].update({
+        'src_code_rel_path': str(addon_dir),
+        'installation_rel_path': str(work_dir / 'installed' / addon_dir.name),
+        'distribution_rel_path': str(work_dir / 'dist'),
+    })
+    dev_config_toml_path.write_text(toml.dumps(dev_config_toml))
+    temp_dir = work_dir / 'tmp'
+    temp_dir.mkdir(exist_ok=True)
+    with open(os.devnull, 'w') as devnull, \
+            mock.patch.object(dev_fns, 'DEV_CONFIG_TOML_PATH', dev_config_toml_path), \
+            mock.patch.object(subprocess, 'run', _stub_subprocess_run), \
+            mock.patch.object(dev_fns, '_is_poetry_installed', lambda: True), \
+            mock.patch.object(tempfile, 'tempdir', str(temp_dir)), \
+            contextlib.redirect_stdout(devnull):
+        yield
+
+# endregion Stubs
+
+
+# region Benchmark Cases
+
+def _time_case(fn: Callable, setup: Optional[Callable], repeat: int) -> list:
+    """
+    Time a function over several runs. The setup function is called before each run and is not timed.
+
+    Args:
+        fn: The function to time.
+        setup: The function preparing the state of each run, or None.
+        repeat: The number of timed runs.
+
+    Returns:
+        The list of run times in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_benchmarks(file_count: int, work_dir: Path, repeat: int = DEFAULT_REPEAT, seed: int = DEFAULT_SEED) -> list:
+    """
+    Run all benchmark cases on a synthetic addon tree of the given size.
+
+    Args:
+        file_count: The number of files in the synthetic addon tree.
+        work_dir: The directory in which the tree and all outputs are created.
+        repeat: The number of timed runs per case.
+        seed: The seed used to generate the tree.
+
+    Returns:
+        A list of result dictionaries, one per case.
+    """
+    print(f'[INFO] Generating synthetic addon tree with {file_count} files...', file=sys.stderr)
+    addon_dir = generate_addon_tree(work_dir / 'src', file_count, seed)
+    installed_dir = work_dir / 'installed' / addon_dir.name
+    dist_dir = work_dir / 'dist'
+
+    def clear_installed():
+        if installed_dir.exists():
+            shutil.rmtree(installed_dir)
+
+    def clear_dist():
+        if dist_dir.exists():
+            shutil.rmtree(dist_dir)
+
+    # Pass an explicit context so the timed runs never read --timings from the benchmark's own command line
+    def sync_code():
+        dev_fns.sync_code(ctx=dev_fns.DevContext())
+
+    def build_addon():
+        dev_fns.build_addon(ctx=dev_fns.DevContext())
+
+    def prepare_zip():
+        # Reproduce the state of the build right before zipping, with the source code and git dependencies in place
+        zip_ctx['ctx'] = dev_fns.DevContext()
+        paths = dev_fns._configure_paths(zip_ctx['ctx'])
+        paths['temp_build_dir'].mkdir(parents=True, exist_ok=True)
+        dev_fns._generate_addon_dependencies(paths, zip_ctx['ctx'])
+        dev_fns._copy_addon_source_code(paths, zip_ctx['ctx'])
+        zip_ctx['paths'] = paths
+
+    def zip_addon():
+        dev_fns._zip_addon(zip_ctx['paths'], zip_ctx['ctx'])
+
+    zip_ctx = {}
+    cases = [
+        ('sync_cold', sync_code, clear_installed),
+        ('sync_warm', sync_code, sync_code),
+        ('build_full', build_addon, clear_dist),
+        ('build_rebuild', build_addon, None),  # Unchanged tree, build_addon has no incremental path
+        ('zip_addon', zip_addon, prepare_zip),
+    ]
+    results = []
+    with _bench_environment(work_dir, addon_dir):
+        for name, fn, setup in cases:
+            times = _time_case(fn, setup, repeat)
+            results.append({
+                'name': name,
+                'files': file_count,
+                'runs': len(times),
+                'min': min(times),
+                'median': statistics.median(times),
+                'mean': statistics.mean(times),
+                'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+            })
+            print(f'[INFO] {name} ({file_count} files): median {results[-1]["median"]:.4f}s', file=sys.stderr)
+    return results
+
+# endregion Benchmark Cases
+
+
+# region Baseline Comparison
+
+def compare_to_baseline(results: list, baseline: list, threshold: float = DEFAULT_THRESHOLD) -> list:
+    """
+    Compare the results to a stored baseline. A case regresses if its median time exceeds the baseline median by more
+    than the threshold. Cases missing from the baseline are ignored.
+
+    Args:
+        results: The results of the current run.
+        baseline: The results of the baseline run.
+        threshold: The allowed relative slowdown, e.g. 0.25 for 25%.
+
+    Returns:
+        A list of dictionaries describing the regressed cases.
+    """
+    baseline_medians = {(result['name'], result['files']): result['median'] for result in baseline}
+    regressions = []
+    for result in results:
+        baseline_median = baseline_medians.get((result['name'], result['files']))
+        if baseline_median is None or baseline_median <= 0:
+            continue
+        ratio = result['median'] / baseline_median
+        if ratio > 1 + threshold:
+            regressions.append({'name': result['name'], 'files': result['files'], 'baseline': baseline_median,
+                                'current': result['median'], 'ratio': ratio})
+    return regressions
+
+# endregion Baseline Comparison
+
+
+def main(argv: Optional[list] = None):
+    """
+    This function is intended to be called by Poetry as a custom command to benchmark the dev_fns workflows (sync,
+    build and zip) on synthetic addon trees. Poetry and pip are stubbed out so only the file handling is measured. The
+    results are written as JSON, and if a baseline is given, the command exits with status 1 on any regression.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the dev_fns workflows on synthetic addon trees.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='File counts of the addon trees.')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Number of timed runs per case.')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Seed of the synthetic addon trees.')
+    parser.add_argument('--output', type=Path, help='Write the JSON results to this file instead of stdout.')
+    parser.add_argument('--baseline', type=Path, help='Compare the results to this stored JSON results file.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed relative slowdown against the baseline, e.g. 0.25 for 25%%.')
+    parser.add_argument('--work-dir', type=Path, help='Directory for the synthetic trees, removed if not given.')
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1.')
+    if any(file_count < 1 for file_count in args.sizes):
+        parser.error('--sizes values must be at least 1.')
+
+    results = []
+    for file_count in args.sizes:
+        if args.work_dir is not None:
+            work_dir = args.work_dir / str(file_count)
+            work_dir.mkdir(parents=True, exist_ok=True)
+            results.extend(run_benchmarks(file_count, work_dir, args.repeat, args.seed))
+        else:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                results.extend(run_benchmarks(file_count, Path(temp_dir), args.repeat, args.seed))
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_to_baseline(results, baseline.get('results', []), args.threshold)
+        for regression in regressions:
+            print(f'[ERROR] {regression["name"]} ({regression["files"]} files) regressed: '
+                  f'{regression["baseline"]:.4f}s -> {regression["current"]:.4f}s ({regression["ratio"]:.2f}x)',
+                  file=sys.stderr)
+        if regressions:
+            exit(1)
+        print(f'[INFO] No regressions against {args.baseline}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
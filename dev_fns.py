@@ -1,10 +1,17 @@
+import argparse
+import contextlib
+import functools
+import json
 import os
 from pathlib import Path
 import platform
+import re
 import shutil
 import subprocess
+import sys
 import tempfile
-from typing import Optional
+import time
+from typing import Optional, Union
 import zipfile
 
 import toml
@@ -57,32 +64,175 @@ def _get_dev_fns_toml() -> dict:
         return toml.load(file)
 
 
-def _get_path(path_key, is_rel_path: bool = False, must_exist: bool = False) -> Optional[Path]:
+class DevContext:
     """
-    Get the path for the source code or installed code directory from the dev_fns.toml file.
+    The context shared by the phases of a dev_fns command. It loads and validates the dev_config.toml file once, loads
+    the pyproject.toml file on first use and records the time spent in each phase of the command.
 
     Args:
-        path_key: The key to get the path from the dev_fns.toml file.
-        is_rel_path: If True, the path is relative to the dev_fns.py file. If False, the path is absolute.
-        must_exist: If True, the path must exist. If False, the path can be empty or not exist.
+        timings: Where to report the phase timings when the command finishes. None disables the report, True prints a
+                 phase breakdown and a path writes the timings as a JSON trace-event file for Chrome or Perfetto.
+        required_keys: The keys of the [addon] table the command cannot run without.
+    """
+
+    def __init__(self, timings: Union[None, bool, Path] = None, required_keys: tuple = ()):
+        self.timings = timings
+        self.spans = []  # (name, start, end) tuples in perf_counter seconds
+        self.start_time = time.perf_counter()
+        self._package_toml = None
+        with self.phase('load config'):
+            self.dev_config = _get_dev_fns_toml()
+            self.validate_dev_config(required_keys)
+
+    def validate_dev_config(self, required_keys: tuple = ()):
+        """
+        Check that the dev_config.toml file has an [addon] table, that its known keys are strings, that the required
+        keys are set and that blender_version, if set, is a 'major.minor[.patch]' version.
+
+        Args:
+            required_keys: The keys of the [addon] table the command cannot run without.
+        """
+        addon_config = self.dev_config.get('addon')
+        if not isinstance(addon_config, dict):
+            raise KeyError(f'[ERROR] Key \'addon\' not found in {DEV_CONFIG_TOML_PATH}.')
+        for key in DEFAULT_DEV_CONFIG_TOML['addon']:
+            if not isinstance(addon_config.get(key, ''), str):
+                raise ValueError(f'[ERROR] Value of {key} in {DEV_CONFIG_TOML_PATH} must be a string.')
+        for key in required_keys:
+            if addon_config.get(key, '') == '':
+                raise KeyError(f'[ERROR] Key {key} is not set in {DEV_CONFIG_TOML_PATH}.')
+        blender_version = addon_config.get('blender_version', '')
+        if blender_version != '' and not re.fullmatch(r'\d+\.\d+(\.\d+)?', blender_version):
+            raise ValueError(f'[ERROR] Value of blender_version in {DEV_CONFIG_TOML_PATH} must be a version like '
+                             f'\'4.3.0\', got \'{blender_version}\'.')
+
+    @property
+    def addon_config(self) -> dict:
+        """The [addon] table of the dev_config.toml file."""
+        return self.dev_config['addon']
+
+    @property
+    def package_toml(self) -> dict:
+        """The contents of the pyproject.toml file, loaded on first use."""
+        if self._package_toml is None:
+            self._package_toml = _get_package_toml()
+        return self._package_toml
+
+    def get_path(self, path_key, is_rel_path: bool = False, must_exist: bool = False) -> Optional[Path]:
+        """
+        Get the path for the source code or installed code directory from the dev_fns.toml file.
+
+        Args:
+            path_key: The key to get the path from the dev_fns.toml file.
+            is_rel_path: If True, the path is relative to the dev_fns.py file. If False, the path is absolute.
+            must_exist: If True, the path must exist. If False, the path can be empty or not exist.
+
+        Returns:
+            The Path object for the source code or installed code directory if the path is valid, otherwise None.
+        """
+        target_path = self.addon_config.get(path_key, None)
+        if target_path not in [None, '', '.']:
+            try:
+                if is_rel_path:
+                    target_path = Path(__file__).parent / target_path
+                else:
+                    target_path = Path(target_path)
+            except Exception as e:
+                print(f'[ERROR] Invalid path for {path_key} in dev_fns.toml, {e}. Please check the path and try again.')
+                return None
+            if (not must_exist) or (must_exist and target_path.exists()):
+                return target_path
+        return None
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Time the wrapped block as a phase of the command.
+
+        Args:
+            name: The name of the phase shown in the timings report.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((name, start, time.perf_counter()))
+
+    def report_timings(self):
+        """Print the phase breakdown or write the trace-event file, depending on the timings setting."""
+        if not self.timings:
+            return
+        end_time = time.perf_counter()
+        if self.timings is True:
+            # Sum the spans by phase name, keeping the order in which the phases first ran
+            totals = {}
+            for name, start, end in self.spans:
+                totals[name] = totals.get(name, 0.0) + (end - start)
+            print('Phase Timings:')
+            for name, duration in totals.items():
+                print(f'    {name:<16}{duration:>10.4f}s')
+            print(f'    {"total":<16}{end_time - self.start_time:>10.4f}s')
+        else:
+            # Chrome trace-event format, complete events with timestamps in microseconds
+            trace_events = [{'name': name, 'cat': 'dev_fns', 'ph': 'X', 'pid': os.getpid(), 'tid': 0,
+                             'ts': (start - self.start_time) * 1e6, 'dur': (end - start) * 1e6}
+                            for name, start, end in self.spans]
+            try:
+                Path(self.timings).write_text(json.dumps({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}))
+            except OSError as e:
+                # Never let the timings report replace the outcome of the command itself
+                print(f'[ERROR] Failed to write phase timings to {self.timings}: {e}')
+                return
+            print(f'Phase timings written to {self.timings}')
+
+
+def _parse_timings_arg(argv: Optional[list] = None) -> Union[None, bool, Path]:
+    """
+    Parse the --timings flag of the Poetry commands. '--timings' prints a phase breakdown and '--timings=<file>' writes
+    the timings as a JSON trace-event file, which must not be empty or an existing directory. Other arguments are
+    ignored.
+
+    Args:
+        argv: The command line arguments, sys.argv[1:] if None.
 
     Returns:
-        The Path object for the source code or installed code directory if the path is valid, otherwise None.
+        None if the flag is not given, True to print the breakdown, or the path of the trace-event file.
     """
-    dev_config_toml = _get_dev_fns_toml()
-    target_path = dev_config_toml.get('addon', {}).get(path_key, None)
-    if target_path not in [None, '', '.']:
-        try:
-            if is_rel_path:
-                target_path = Path(__file__).parent / target_path
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument('--timings', nargs='?', const=True, default=None)
+    args, _ = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+    if args.timings is None or args.timings is True:
+        return args.timings
+    if args.timings == '' or Path(args.timings).is_dir():
+        parser.error(f'--timings file must be a file path, got \'{args.timings}\'.')
+    return Path(args.timings)
+
+
+def _dev_command(required_keys: tuple = ()):
+    """
+    Decorator for the functions called by Poetry as custom commands. It creates the DevContext shared by the phases of
+    the command from the command line arguments, unless one is passed as the ctx keyword argument, and reports the phase
+    timings when the command finishes.
+
+    Args:
+        required_keys: The keys of the [addon] table the command cannot run without, checked before the command runs.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, ctx: Optional[DevContext] = None, **kwargs):
+            if ctx is None:
+                ctx = DevContext(timings=_parse_timings_arg(), required_keys=required_keys)
             else:
-                target_path = Path(target_path)
-        except Exception as e:
-            print(f'[ERROR] Invalid path for {path_key} in dev_fns.toml, {e}. Please check the path and try again.')
-            return None
-        if (not must_exist) or (must_exist and target_path.exists()):
-            return target_path
-    return None
+                ctx.validate_dev_config(required_keys)
+            try:
+                return fn(ctx, *args, **kwargs)
+            finally:
+                ctx.report_timings()
+
+        return wrapper
+
+    return decorator
 
 
 def _get_package_toml() -> dict:
@@ -102,30 +252,31 @@ def _get_package_toml() -> dict:
 
 def _is_poetry_installed() -> bool:
     """
-    Checks if Poetry is installed on the system.
+    Checks if Poetry is installed on the system by looking it up on PATH, without spawning a Poetry process.
 
     Returns:
         bool: True if Poetry is installed, False otherwise.
     """
-    try:
-        subprocess.run(['poetry', '--version'], capture_output=True, text=True, check=True)
-        return True
-    except Exception as e:
-        print(f'[ERROR] Poetry is not installed: {e}')
-        ...
-    return False
+    if shutil.which('poetry') is None:
+        print('[ERROR] Poetry is not installed: poetry executable not found on PATH.')
+        return False
+    return True
 
 # endregion Shared Functions
 
 
 # region Sync Code Function
 
-def sync_code():
+@_dev_command()
+def sync_code(ctx: DevContext):
     """
     This function is used to sync the code installed as Blender's addon to the current source code. The source code
     path and installed code path are read from dev_fns.toml file. The older installed files will always be overwritten
     by the source code files. New source code files will be copied. Deleted source code files will be deleted from the
     installed code directory.
+
+    Args:
+        ctx (DevContext): The context shared by the phases of the command, created by the _dev_command decorator.
     """
 
     def get_file_list_to_sync():
@@ -137,32 +288,35 @@ def sync_code():
         """
         excluded_dirs = {'__pycache__', 'libs'}  # Exclude local libraries packed with the addon
         excluded_files = {'deps_installed'}  # Exclude the file that marks the dependencies as installed
+        text_suffixes = ['.py', '.txt', '.json', '.toml', '.md', '.html', '.css', '.js', 'qss']
         files_to_sync_dict = {'add': [], 'copy': [], 'delete': []}
-        source_code_files = [file for file in list(source_code_path.rglob('*')) if file.is_file()]
-        installed_code_files = [file for file in list(installed_code_path.rglob('*')) if file.is_file() and
-                                set(file.parts) & excluded_dirs == set()]
-        # Check for files to add or copy
-        for source_code_file in source_code_files:
-            installed_code_file = installed_code_path / source_code_file.relative_to(source_code_path)
-            if installed_code_file.exists():
-                print(source_code_file)
-                # Check if the source code file is a text file, if so compare the contents, otherwise copy the file. For
-                # binary files, compare the last modified time. If the source code file is newer, copy it.
-                if source_code_file.suffix in ['.py', '.txt', '.json', '.toml', '.md', '.html', '.css', '.js', 'qss']:
-                    if source_code_file.read_text() != installed_code_file.read_text():
-                        files_to_sync_dict['copy'].append((source_code_file, installed_code_file))
-                else:
-                    if installed_code_file.name != 'deps_installed':
-                        if source_code_file.stat().st_mtime > installed_code_file.stat().st_mtime:
+        with ctx.phase('scan'):
+            source_code_files = [file for file in list(source_code_path.rglob('*')) if file.is_file()]
+            installed_code_files = [file for file in list(installed_code_path.rglob('*')) if file.is_file() and
+                                    set(file.parts) & excluded_dirs == set()]
+        with ctx.phase('diff'):
+            # Check for files to add or copy
+            for source_code_file in source_code_files:
+                installed_code_file = installed_code_path / source_code_file.relative_to(source_code_path)
+                if installed_code_file.exists():
+                    print(source_code_file)
+                    # Check if the source code file is a text file, if so compare the contents, otherwise copy the
+                    # file. For binary files, compare the last modified time. If the source code file is newer, copy it.
+                    if source_code_file.suffix in text_suffixes:
+                        if source_code_file.read_text() != installed_code_file.read_text():
                             files_to_sync_dict['copy'].append((source_code_file, installed_code_file))
-            else:
-                files_to_sync_dict['add'].append((source_code_file, installed_code_file))
-        # Check for files to delete
-        for installed_code_file in installed_code_files:
-            if installed_code_file.name not in excluded_files:
-                source_code_file = source_code_path / installed_code_file.relative_to(installed_code_path)
-                if not source_code_file.exists():
-                    files_to_sync_dict['delete'].append(installed_code_file)
+                    else:
+                        if installed_code_file.name != 'deps_installed':
+                            if source_code_file.stat().st_mtime > installed_code_file.stat().st_mtime:
+                                files_to_sync_dict['copy'].append((source_code_file, installed_code_file))
+                else:
+                    files_to_sync_dict['add'].append((source_code_file, installed_code_file))
+            # Check for files to delete
+            for installed_code_file in installed_code_files:
+                if installed_code_file.name not in excluded_files:
+                    source_code_file = source_code_path / installed_code_file.relative_to(installed_code_path)
+                    if not source_code_file.exists():
+                        files_to_sync_dict['delete'].append(installed_code_file)
         # Print the files to sync by category
         if len(files_to_sync_dict['add']) + len(files_to_sync_dict['copy']) + len(files_to_sync_dict['delete']) == 0:
             print('No files to sync.')
@@ -185,26 +339,28 @@ def sync_code():
         """
         Sync the files between the source code and installed code directories.
         """
-        # Add new files
-        for source_code_file, installed_code_file in files_to_sync['add']:
-            if not installed_code_file.parent.exists():
-                installed_code_file.parent.mkdir(parents=True)
-            shutil.copyfile(source_code_file, installed_code_file)
-        # Copy existing files
-        for source_code_file, installed_code_file in files_to_sync['copy']:
-            shutil.copyfile(source_code_file, installed_code_file)
-        # Delete files
-        for installed_code_file in files_to_sync['delete']:
-            installed_code_file.unlink()
+        with ctx.phase('copy'):
+            # Add new files
+            for source_code_file, installed_code_file in files_to_sync['add']:
+                if not installed_code_file.parent.exists():
+                    installed_code_file.parent.mkdir(parents=True)
+                shutil.copyfile(source_code_file, installed_code_file)
+            # Copy existing files
+            for source_code_file, installed_code_file in files_to_sync['copy']:
+                shutil.copyfile(source_code_file, installed_code_file)
+        with ctx.phase('cleanup'):
+            # Delete files
+            for installed_code_file in files_to_sync['delete']:
+                installed_code_file.unlink()
         # Report the number of files synced
         print(f'{len(files_to_sync["add"])} File(s) Added. {len(files_to_sync["copy"])} File(s) Copied. '
               f'{len(files_to_sync["delete"])} File(s) Deleted.')
 
-    source_code_path = _get_path('src_code_rel_path', is_rel_path=True, must_exist=True)
+    source_code_path = ctx.get_path('src_code_rel_path', is_rel_path=True, must_exist=True)
     if source_code_path is None:
         print('[ERROR] Source code path is not set in dev_fns.toml. Please set the source code path and try again.')
         exit(1)
-    installed_code_path = _get_path('installation_rel_path', is_rel_path=True, must_exist=False)
+    installed_code_path = ctx.get_path('installation_rel_path', is_rel_path=True, must_exist=False)
     if installed_code_path is None:
         print('[ERROR] Installation path is not set in dev_fns.toml. Please set the installation path and try again.')
         exit(1)
@@ -219,25 +375,26 @@ def sync_code():
 
 # region Build Extension Functions
 
-def _configure_paths(package_toml: dict) -> dict:
+def _configure_paths(ctx: DevContext) -> dict:
     """
     Configures the paths for the addon source code, dependencies, and the destination zip file.
 
     Args:
-        package_toml (dict): The package information from the pyproject.toml file.
+        ctx (DevContext): The context shared by the phases of the command, holding the package information from the
+                          pyproject.toml file and the dev_config.toml values.
 
     Returns:
         dict: A dictionary containing the paths for the addon source code, dependencies, and the destination zip file.
     """
     # Ensure the required keys are present in the package.toml and dev_config.toml files
     try:
-        addon_name = package_toml['tool']['poetry']['name']
-        addon_version = package_toml['tool']['poetry']['version']
-        addon_source_code_dir = _get_path('src_code_rel_path', is_rel_path=True, must_exist=True)
+        addon_name = ctx.package_toml['tool']['poetry']['name']
+        addon_version = ctx.package_toml['tool']['poetry']['version']
+        addon_source_code_dir = ctx.get_path('src_code_rel_path', is_rel_path=True, must_exist=True)
         temp_build_dir = Path(tempfile.mkdtemp()) / (addon_name + '-' + addon_version) / addon_source_code_dir.name
         temp_build_libs_dir = temp_build_dir / 'libs'  # Deps are placed in a 'libs' subdirectory
         temp_build_dir_to_zip = temp_build_dir.parent  # The source code has to be in a subdirectory of the zip file
-        dist_dir = _get_path('distribution_rel_path', is_rel_path=True, must_exist=False)
+        dist_dir = ctx.get_path('distribution_rel_path', is_rel_path=True, must_exist=False)
         dist_file_path = dist_dir / f'{addon_name}-{addon_version}.zip'
     except KeyError as e:
         raise KeyError(f'[ERROR] Key {e} not found in pyproject.toml or dev_config.toml file.')
@@ -260,13 +417,14 @@ def _configure_paths(package_toml: dict) -> dict:
     return output
 
 
-def _copy_addon_source_code(paths: dict):
+def _copy_addon_source_code(paths: dict, ctx: DevContext):
     """
     Copies the source code of the Blender addon to the build directory.
 
     Args:
         paths: dict: A dictionary containing the paths for the addon source code, dependencies, and the destination zip
                      file.
+        ctx (DevContext): The context shared by the phases of the command.
     """
     print('Copying source code...')
     # Check if the source code directory exists
@@ -274,14 +432,15 @@ def _copy_addon_source_code(paths: dict):
         raise FileNotFoundError(f"The source code directory {paths['addon_source_code_dir']} does not exist.")
     # Copy the content of the source code directory to the build directory
     temp_build_dir = paths['temp_build_dir']
-    for item in paths['addon_source_code_dir'].iterdir():
-        if item.is_file():
-            shutil.copy(item, temp_build_dir)
-        elif item.is_dir():
-            shutil.copytree(item, temp_build_dir / item.name)
+    with ctx.phase('copy'):
+        for item in paths['addon_source_code_dir'].iterdir():
+            if item.is_file():
+                shutil.copy(item, temp_build_dir)
+            elif item.is_dir():
+                shutil.copytree(item, temp_build_dir / item.name, dirs_exist_ok=True)  # Merge with installed git deps
 
 
-def _generate_addon_dependencies(paths: dict):
+def _generate_addon_dependencies(paths: dict, ctx: DevContext):
     """
     Collects the dependencies of the addon and copies them to the temporary build directory. The dependencies are
     separated into two files: requirements_pypi.txt and requirements_git.txt. The dependencies in requirements_pypi.txt
@@ -291,6 +450,7 @@ def _generate_addon_dependencies(paths: dict):
     Args:
         paths: dict: A dictionary containing the paths for the addon source code, dependencies, and the destination zip
                      file.
+        ctx (DevContext): The context shared by the phases of the command.
     """
 
     def gen_requirements_files():
@@ -324,24 +484,27 @@ def _generate_addon_dependencies(paths: dict):
     # Use Poetry to generate the requirements.txt file for the addon
     print('Generating addon dependencies...')
     # Generate the requirements files
-    gen_requirements_files()
+    with ctx.phase('export'):
+        gen_requirements_files()
     # Use Poetry to run this command "poetry run python -m pip install -r .\requirements_git.txt -t <target_path>
     # --no-deps" to install the git dependencies in the temporary build directory for packaging.
     print('Installing git dependencies...')
     requirements_git_file = paths['requirements_git_file']
     if requirements_git_file.exists():
         libs_dir = paths['temp_build_libs_dir']
-        subprocess.run(['poetry', 'run', 'python', '-m', 'pip', 'install', '-r', str(requirements_git_file), '-t',
-                        libs_dir, '--no-deps'], cwd=Path(__file__).parent, check=True)
+        with ctx.phase('pip install'):
+            subprocess.run(['poetry', 'run', 'python', '-m', 'pip', 'install', '-r', str(requirements_git_file), '-t',
+                            libs_dir, '--no-deps'], cwd=Path(__file__).parent, check=True)
 
 
-def _zip_addon(paths: dict):
+def _zip_addon(paths: dict, ctx: DevContext):
     """
     Zips the temporary build directory into a zip file and copy it to the dist directory.
 
     Args:
         paths: dict: A dictionary containing the paths for the addon source code, dependencies, and the destination zip
                      file.
+        ctx (DevContext): The context shared by the phases of the command.
     """
     exclude_files = ['__pycache__', '.git', '.gitignore', '.vscode', '.idea']
     print('Zipping addon...')
@@ -355,7 +518,7 @@ def _zip_addon(paths: dict):
         dist_file_path.unlink()
     # Zip the temporary build directory
     temp_build_dir_to_zip = paths['temp_build_dir_to_zip']
-    with zipfile.ZipFile(dist_file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    with ctx.phase('zip'), zipfile.ZipFile(dist_file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
         for root, dirs, files in os.walk(temp_build_dir_to_zip):
             root_path = Path(root)
             for file in files:
@@ -364,11 +527,13 @@ def _zip_addon(paths: dict):
                     zipf.write(file_path, file_path.relative_to(temp_build_dir_to_zip))
 
     # Clean up the temporary build directory
-    shutil.rmtree(paths['temp_build_dir'])
+    with ctx.phase('cleanup'):
+        shutil.rmtree(paths['temp_build_dir'])
     print(f'Addon zip file created: {dist_file_path}')
 
 
-def build_addon():
+@_dev_command()
+def build_addon(ctx: DevContext):
     """
     This is a function intended to be called by Poetry as a custom command to build the Blender addon as a zip file for
     distribution. It does the following:
@@ -383,6 +548,9 @@ def build_addon():
     The git dependencies are mainly the internal packages and need to be distributed with the addon. The PyPI
     dependencies are will be installed by pip which will resolve the dependencies with the Blender's Python environment
     automatically.
+
+    Args:
+        ctx (DevContext): The context shared by the phases of the command, created by the _dev_command decorator.
     """
     print('Building Blender addon...')
     # Check if Poetry is installed
@@ -390,62 +558,68 @@ def build_addon():
         raise EnvironmentError('Poetry is not installed. Please install Poetry to build the addon.')
     # Get the package information from the pyproject.toml file
     try:
-        package_toml = _get_package_toml()
-        addon_name = package_toml['tool']['poetry']['name']
-        addon_version = package_toml['tool']['poetry']['version']
+        addon_name = ctx.package_toml['tool']['poetry']['name']
+        addon_version = ctx.package_toml['tool']['poetry']['version']
     except KeyError as e:
         raise KeyError(f'[ERROR] Key {e} not found in pyproject.toml file.')
     # Create a temporary build directory
     print(f'Building addon: {addon_name} {addon_version}...')
-    paths = _configure_paths(package_toml)
+    paths = _configure_paths(ctx)
     temp_build_dir = paths['temp_build_dir']
     temp_build_dir.mkdir(parents=True, exist_ok=True)
     # Collect the dependencies of the addon and copy them to the temporary build directory
-    _generate_addon_dependencies(paths)
+    _generate_addon_dependencies(paths, ctx)
     # Copy the source code of the addon to the temporary build directory
-    _copy_addon_source_code(paths)
+    _copy_addon_source_code(paths, ctx)
     # Zip the temporary build directory into a zip file and copy it to the dist directory
-    _zip_addon(paths)
+    _zip_addon(paths, ctx)
 
 # endregion Build Extension Functions
 
 
 # region Add Auto Launch Script
 
-def add_auto_launch_script():
+@_dev_command()
+def add_auto_launch_script(ctx: DevContext):
     """
     Add a script to the Blender startup directory to launch the Honeycomb prototype automatically after Blender starts.
     The correct operator must be invoked through bpy.ops.wm to run the Honeycomb prototype. It must be invoked through
     Blender's timer system (0.1s after it starts after Blender starts) to ensure that the Blender context is ready.
+
+    Args:
+        ctx (DevContext): The context shared by the phases of the command, created by the _dev_command decorator.
     """
 
-    dev_config = _get_dev_fns_toml()
+    addon_config = ctx.addon_config
     script = f'import bpy\n\n' \
              f'def execute_after_startup():\n' \
-             f'    print(\'Running {dev_config.get("addon", {}).get("addon_print_name", "Unknown")}\')\n' \
-             f'    {dev_config.get("addon", {}).get("addon_operator_id", "unknown")}()\n\n' \
+             f'    print(\'Running {addon_config.get("addon_print_name", "Unknown")}\')\n' \
+             f'    {addon_config.get("addon_operator_id", "unknown")}()\n\n' \
              f'bpy.app.timers.register(execute_after_startup, first_interval=0.1)\n'
 
-    startup_script_path = _get_path('startup_script_rel_path', is_rel_path=True, must_exist=False)
-    if not startup_script_path.exists():
-        startup_script_path.mkdir(parents=True)
-    auto_launch_script_path = startup_script_path / (f'launch_'
-                                                     f'{dev_config.get("addon", {}).get("addon_name", "unknown")}.py')
-    with open(auto_launch_script_path, 'w') as file:
-        file.write(script)
+    startup_script_path = ctx.get_path('startup_script_rel_path', is_rel_path=True, must_exist=False)
+    with ctx.phase('write script'):
+        if not startup_script_path.exists():
+            startup_script_path.mkdir(parents=True)
+        addon_name = addon_config.get('addon_name', 'unknown')
+        auto_launch_script_path = startup_script_path / f'launch_{addon_name}.py'
+        with open(auto_launch_script_path, 'w') as file:
+            file.write(script)
 
 # endregion
 
 
 # region Run Blender
 
-def run_blender(install_blender: bool = False):
+@_dev_command(required_keys=('blender_version', 'blender_rel_path'))
+def run_blender(ctx: DevContext, install_blender: bool = False):
     """
     Run Blender that is installed within this package's directory using the path specified in the dev_fns.toml file. If
     Blender is not installed, download it from the Blender website and set it up (unzip the file, remove the zip file,
     and add a portable directory).
 
     Args:
+        ctx (DevContext): The context shared by the phases of the command, created by the _dev_command decorator.
         install_blender (bool): If True, download Blender from the Blender website and set it up. If False, run the
                                 Blender executable in the package's directory
     """
@@ -477,19 +651,16 @@ def run_blender(install_blender: bool = False):
         portal_dir = Path(__file__).parent / blender_dir_name / 'portable'
         portal_dir.mkdir()
 
-    dev_config = _get_dev_fns_toml()
-
-    try:
-        blender_version = dev_config.get('addon', {}).get('blender_version')
-        blender_minor_version = blender_version.split('.')[0] + '.' + blender_version.split('.')[1]
-        blender_dir_name = dev_config.get('addon', {}).get('blender_rel_path')
-    except KeyError as e:
-        raise KeyError(f'[ERROR] Key {e} not found in dev_fns.toml file.')
+    # Both keys are checked by the _dev_command decorator, blender_version is a 'major.minor[.patch]' version
+    blender_version = ctx.addon_config['blender_version']
+    blender_minor_version = blender_version.split('.')[0] + '.' + blender_version.split('.')[1]
+    blender_dir_name = ctx.addon_config['blender_rel_path']
 
     # Download Blender if it doesn't exist
     blender_dir_path = Path(__file__).parent / blender_dir_name
     if install_blender and not blender_dir_path.exists():
-        download_blender()
+        with ctx.phase('download'):
+            download_blender()
     # Find Blender executable and run it
     os = platform.system()
     if os == 'Darwin':
@@ -501,6 +672,7 @@ def run_blender(install_blender: bool = False):
     else:
         raise Exception(f'Unsupported OS: {os}')
 
-    subprocess.run([str(blender_exe_path)])
+    with ctx.phase('blender'):
+        subprocess.run([str(blender_exe_path)])
 
 # endregion